@@ -4,13 +4,139 @@ Task Processor CLI Tool
 
 A production-grade CLI tool for processing JSON files containing task items.
 Validates input strictly and outputs processed results.
+
+The module passes mypy --strict and can be compiled with mypyc for faster
+validation. A compiled module can only be imported: `python -m
+src.task_processor` fails with "No code object available", and tests that
+monkeypatch module globals or run the CLI in a subprocess need the plain
+Python source. Remove the built .so files before running them.
 """
 
 import argparse
+import errno
 import json
 import logging
+import math
+import mmap
+import os
+import re
+import stat
 import sys
-from typing import Any
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Union
+
+# Prefer orjson for parsing and serialization; fall back to the stdlib json module.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# orjson converts integers outside the int64/uint64 range to floats. Every
+# 19-digit positive literal fits in uint64, so only '-' followed by 19 digits or
+# any run of 20 or more digits can lose precision. Documents containing one are
+# parsed with json instead; a false positive (e.g. in a string) only costs speed.
+_LONG_INT_NEEDLES = (b'0' * 20, b'-' + b'0' * 19)
+# Maps ASCII digits to '0', keeps '-', and blanks every other byte
+_DIGIT_TABLE = bytes(
+    0x30 if 0x30 <= c <= 0x39 else c if c == 0x2d else 0x20 for c in range(256)
+)
+_SCAN_CHUNK_SIZE = 1024 * 1024
+
+
+def _has_long_int(buf: Union[bytes, mmap.mmap]) -> bool:
+    """Return True if buf may contain an integer literal orjson cannot parse exactly."""
+    overlap = len(_LONG_INT_NEEDLES[0]) - 1
+    for start in range(0, len(buf), _SCAN_CHUNK_SIZE):
+        chunk = buf[start:start + _SCAN_CHUNK_SIZE + overlap].translate(_DIGIT_TABLE)
+        if any(needle in chunk for needle in _LONG_INT_NEEDLES):
+            return True
+    return False
+
+
+# A JSON \\u escape of a UTF-16 surrogate that is not part of a valid pair. The
+# leading even run of backslashes makes sure the matched backslash starts an escape.
+_LONE_SURROGATE_RE = re.compile(
+    rb'(?<!\\)(?:\\\\)*'
+    rb'(?:\\u[dD][89abAB][0-9a-fA-F]{2}(?!\\u[dD][c-fC-F][0-9a-fA-F]{2})'
+    rb'|(?<!\\u[dD][89abAB][0-9a-fA-F]{2})\\u[dD][c-fC-F][0-9a-fA-F]{2})'
+)
+
+
+def _lone_surrogate_escapes(data: bytes) -> List['re.Match[bytes]']:
+    """Return the lone surrogate escapes in data (cheap when it has none)."""
+    if b'\\ud' not in data and b'\\uD' not in data:
+        return []
+    return list(_LONE_SURROGATE_RE.finditer(data))
+
+
+class _InvalidJSONError(ValueError):
+    """Input the stdlib json module accepts but orjson rejects as invalid JSON."""
+
+
+def _reject_constant(token: str) -> Any:
+    raise _InvalidJSONError(f"non-finite number {token} is not valid JSON")
+
+
+def _parse_finite_float(token: str) -> float:
+    value = float(token)
+    if not math.isfinite(value):
+        raise _InvalidJSONError(f"number {token} is out of range for a double")
+    return value
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON with the stdlib, rejecting what orjson rejects but json accepts."""
+    lone = _lone_surrogate_escapes(data)
+    if lone:
+        raise _InvalidJSONError(
+            f"lone surrogate escape {lone[0].group()[-6:].decode('ascii')}"
+        )
+    return json.loads(data, parse_constant=_reject_constant, parse_float=_parse_finite_float)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson only when no integer could lose precision."""
+    if orjson is not None and not _has_long_int(data):
+        return orjson.loads(data)
+    return _json_loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits; json can still serialize them exactly
+            pass
+    # Write raw UTF-8 like orjson so the output style does not depend on the backend
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# ijson is optional; without it large inputs are loaded in full like any other.
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None
+
+# Read size used when the input size cannot be determined up front
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Inputs larger than this are memory-mapped rather than read (requires orjson)
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Inputs larger than this are streamed item by item (requires ijson)
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Number of validated items processed and written together when streaming
+_STREAM_BATCH_SIZE = 1024
+
+# Error text yajl-based ijson backends report for integers beyond 64 bits
+_YAJL_INTEGER_OVERFLOW = 'integer overflow'
+
+# Fields every input item must have, in the order they are checked
+_REQUIRED_FIELDS = ('id', 'name', 'value')
 
 # Module logger (configured later by setup_logging)
 logger = logging.getLogger(__name__)
@@ -38,7 +164,7 @@ class ValidationError(Exception):
     pass
 
 
-def validate_item(item: Any, index: int) -> dict:
+def validate_item(item: Any, index: int) -> Dict[str, Any]:
     """
     Validate a single item from the input list.
 
@@ -47,7 +173,8 @@ def validate_item(item: Any, index: int) -> dict:
         index: The index of the item in the list (for error messages)
 
     Returns:
-        The validated item as a dictionary
+        The validated item as a dictionary. This is the input dict itself
+        when it has no fields beyond id, name and value.
 
     Raises:
         ValidationError: If the item is invalid
@@ -55,43 +182,55 @@ def validate_item(item: Any, index: int) -> dict:
     if not isinstance(item, dict):
         raise ValidationError(f"Item at index {index} is not an object")
 
-    # Check required fields
-    required_fields = ['id', 'name', 'value']
-    for field in required_fields:
+    # Check required fields with membership tests rather than indexing, so
+    # dict subclasses with __missing__ (defaultdict, Counter) are handled too
+    for field in _REQUIRED_FIELDS:
         if field not in item:
             raise ValidationError(f"Item at index {index} is missing required field '{field}'")
 
-    # Validate id (integer, but not bool since bool is subclass of int)
-    if isinstance(item['id'], bool) or not isinstance(item['id'], int):
+    # Fetch each field once for the checks below
+    item_id = item['id']
+    name = item['name']
+    value = item['value']
+
+    # Exact type checks: type(True) is bool, so bools are rejected without a
+    # separate test. Subclasses such as numpy.int64 are rejected too, but JSON
+    # parsers only ever produce plain int/float.
+
+    # Validate id (integer, not bool)
+    if type(item_id) is not int:
         raise ValidationError(
-            f"Item at index {index}: 'id' must be an integer, got {type(item['id']).__name__}"
+            f"Item at index {index}: 'id' must be an integer, got {type(item_id).__name__}"
         )
 
     # Validate name (non-empty string)
-    if not isinstance(item['name'], str):
+    if not isinstance(name, str):
         raise ValidationError(
-            f"Item at index {index}: 'name' must be a string, got {type(item['name']).__name__}"
+            f"Item at index {index}: 'name' must be a string, got {type(name).__name__}"
         )
-    if not item['name'].strip():
+    # isspace() is False for '' and allocates nothing, unlike strip()
+    if not name or name.isspace():
         raise ValidationError(f"Item at index {index}: 'name' must be a non-empty string")
 
-    # Validate value (numeric - int or float)
-    if not isinstance(item['value'], (int, float)):
+    # Validate value (numeric - int or float, not bool)
+    value_type = type(value)
+    if value_type is not int and value_type is not float:
         raise ValidationError(
-            f"Item at index {index}: 'value' must be numeric, got {type(item['value']).__name__}"
+            f"Item at index {index}: 'value' must be numeric, got {value_type.__name__}"
         )
-    # Check for boolean (which is a subclass of int in Python)
-    if isinstance(item['value'], bool):
-        raise ValidationError(f"Item at index {index}: 'value' must be numeric, got bool")
+
+    # All three fields are present, so three keys means nothing extra to strip
+    if len(item) == 3:
+        return item
 
     return {
-        'id': item['id'],
-        'name': item['name'],
-        'value': item['value']
+        'id': item_id,
+        'name': name,
+        'value': value
     }
 
 
-def validate_input(data: Any) -> list:
+def validate_input(data: Any) -> List[Dict[str, Any]]:
     """
     Validate the entire input data structure.
 
@@ -107,23 +246,43 @@ def validate_input(data: Any) -> list:
     if not isinstance(data, list):
         raise ValidationError("Input must be a JSON array")
 
-    validated_items = []
-    seen_ids = set()
+    validated_items: List[Dict[str, Any]] = []
+    seen_ids: Set[int] = set()
+    # Hoist bound-method lookups out of the loop
+    append_item = validated_items.append
+    add_id = seen_ids.add
 
     for index, item in enumerate(data):
         validated_item = validate_item(item, index)
+        item_id = validated_item['id']
 
         # Check for duplicate IDs
-        if validated_item['id'] in seen_ids:
-            raise ValidationError(f"Duplicate id found: {validated_item['id']}")
-        seen_ids.add(validated_item['id'])
+        if item_id in seen_ids:
+            raise ValidationError(f"Duplicate id found: {item_id}")
+        add_id(item_id)
 
-        validated_items.append(validated_item)
+        append_item(validated_item)
 
     return validated_items
 
 
-def process_items(items: list) -> list:
+def _build_processed(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build the output records for validated items (shared by batch and stream paths)."""
+    # Bind len locally to avoid a global lookup per item
+    _len = len
+    return [
+        {
+            'id': item['id'],
+            'name': item['name'],
+            'value': item['value'],
+            'processed': True,
+            'name_length': _len(item['name'])
+        }
+        for item in items
+    ]
+
+
+def process_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Process the validated items.
 
@@ -133,21 +292,50 @@ def process_items(items: list) -> list:
     Returns:
         Processed items with additional metadata
     """
-    processed = []
-    for item in items:
-        processed_item = {
-            'id': item['id'],
-            'name': item['name'],
-            'value': item['value'],
-            'processed': True,
-            'name_length': len(item['name'])
-        }
-        processed.append(processed_item)
+    processed = _build_processed(items)
 
-    logger.info(f"Successfully processed {len(processed)} items")
+    logger.info("Successfully processed %d items", len(processed))
     return processed
 
 
+def _read_fd_bytes(fd: int, size: int) -> bytes:
+    """
+    Read the rest of an open file descriptor as bytes.
+
+    The file is normally read with a single read() of the expected size; the
+    loop only continues if the read comes back short (e.g. the file is growing
+    or the size is not reported, as for pipes).
+    """
+    chunks = []
+    while True:
+        chunk = os.read(fd, max(size, _READ_CHUNK_SIZE))
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+
+def _load_file(path: str) -> Any:
+    """
+    Read and parse a JSON file using raw OS file descriptors.
+
+    Large files are memory-mapped and parsed in place when orjson is available,
+    avoiding a copy of the whole file into a bytes object.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if orjson is not None and size > MMAP_THRESHOLD_BYTES:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if _has_long_int(mm):
+                    return _json_loads(mm[:])
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(_read_fd_bytes(fd, size))
+    finally:
+        os.close(fd)
+
+
 def read_input_file(input_path: str) -> Any:
     """
     Read and parse the input JSON file.
@@ -162,13 +350,12 @@ def read_input_file(input_path: str) -> Any:
         ValidationError: If file cannot be read or parsed
     """
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        logger.info(f"Successfully read input file: {input_path}")
+        data = _load_file(input_path)
+        logger.info("Successfully read input file: %s", input_path)
         return data
     except FileNotFoundError:
         raise ValidationError(f"Input file not found: {input_path}")
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, _InvalidJSONError) as e:
         raise ValidationError(f"Invalid JSON in input file: {e}")
     except PermissionError:
         raise ValidationError(f"Permission denied reading file: {input_path}")
@@ -176,7 +363,7 @@ def read_input_file(input_path: str) -> Any:
         raise ValidationError(f"Error reading input file: {e}")
 
 
-def write_output_file(output_path: str, data: list) -> None:
+def write_output_file(output_path: str, data: List[Dict[str, Any]]) -> None:
     """
     Write processed data to output JSON file.
 
@@ -188,9 +375,9 @@ def write_output_file(output_path: str, data: list) -> None:
         ValidationError: If file cannot be written
     """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        logger.info(f"Successfully wrote output file: {output_path}")
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(data))
+        logger.info("Successfully wrote output file: %s", output_path)
     except PermissionError:
         raise ValidationError(f"Permission denied writing to file: {output_path}")
     except Exception as e:
@@ -208,6 +395,9 @@ def process_command(input_path: str, output_path: str) -> int:
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    if ijson is not None and _input_size(input_path) > STREAM_THRESHOLD_BYTES:
+        return process_command_stream(input_path, output_path)
+
     try:
         # Read input
         data = read_input_file(input_path)
@@ -224,17 +414,250 @@ def process_command(input_path: str, output_path: str) -> int:
         return 0
 
     except ValidationError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return 1
 
 
+def _input_size(input_path: str) -> int:
+    """Return the size of the input file, or -1 if it cannot be determined."""
+    try:
+        return os.path.getsize(input_path)
+    except OSError:
+        return -1
+
+
+def _create_temp_output(target_path: str) -> Tuple[int, str]:
+    """
+    Create a new temporary file next to target_path and open it for writing.
+
+    The file is created with mode 0666 like open(target_path, 'wb'), so the
+    process umask applies as usual (tempfile.mkstemp would force 0600).
+
+    Returns:
+        (file descriptor, temporary file path)
+    """
+    directory, name = os.path.split(target_path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    for _ in range(100):
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(errno.EEXIST, "No usable temporary file name", directory)
+
+
+def _copy_existing_mode(target_path: str, temp_path: str) -> None:
+    """Give temp_path the permission bits of target_path, if target_path exists."""
+    try:
+        mode = stat.S_IMODE(os.stat(target_path).st_mode)
+    except FileNotFoundError:
+        return
+    os.chmod(temp_path, mode)
+
+
+class _SurrogateCheckingReader:
+    """
+    Binary reader that rejects JSON escapes of lone UTF-16 surrogates.
+
+    yajl-based ijson backends silently replace a lone surrogate escape such as
+    "\\ud800" with '?', while orjson (and so the in-memory path) rejects the
+    document. Each chunk is scanned as ijson reads it; a little context is
+    carried over so escapes split across reads are still matched correctly.
+    """
+
+    # Bytes kept from the previous read; longer than any match plus its context
+    _CARRY = 64
+    # A high surrogate this close to the end may be completed by the next read
+    _PENDING = 12
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self._carry = b''
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._f.read(size)
+        if size == 0:
+            return chunk
+
+        data = self._carry + chunk
+        # Matches ending here or earlier were judged by the previous read
+        judged = max(len(self._carry) - self._PENDING, 0)
+        limit = len(data) if not chunk else len(data) - self._PENDING
+        for match in _lone_surrogate_escapes(data):
+            if judged < match.end() <= limit:
+                raise ValidationError(
+                    "Invalid JSON in input file: lone surrogate escape "
+                    f"{match.group()[-6:].decode('ascii')}"
+                )
+        self._carry = data[-self._CARRY:]
+        return chunk
+
+
+def _write_stream_batch(fout: BinaryIO, batch: List[Dict[str, Any]], count: int) -> None:
+    """Write processed records for a batch of validated items to a streamed array."""
+    for record in _build_processed(batch):
+        # Indent each object one level so the layout matches write_output_file
+        fout.write(b',\n  ' if count else b'\n  ')
+        fout.write(_dumps(record).replace(b'\n', b'\n  '))
+        count += 1
+
+
+def _stream_items(fin: BinaryIO, fout: BinaryIO, backend: Any) -> int:
+    """
+    Validate, process and write the items of a JSON array using an ijson backend.
+
+    Returns:
+        The number of items processed
+
+    Raises:
+        ValidationError: If the input is invalid
+        ijson.JSONError: If the input cannot be parsed by this backend
+    """
+    events = backend.parse(_SurrogateCheckingReader(fin), use_float=True)
+    try:
+        _, event, _ = next(events)
+    except StopIteration:
+        raise ValidationError("Invalid JSON in input file: empty document")
+    if event != 'start_array':
+        raise ValidationError("Input must be a JSON array")
+
+    seen_ids: Set[int] = set()
+    batch: List[Dict[str, Any]] = []
+    count = 0
+    fout.write(b'[')
+    for index, item in enumerate(backend.items(events, 'item')):
+        validated_item = validate_item(item, index)
+
+        # Check for duplicate IDs
+        if validated_item['id'] in seen_ids:
+            raise ValidationError(f"Duplicate id found: {validated_item['id']}")
+        seen_ids.add(validated_item['id'])
+
+        batch.append(validated_item)
+        if len(batch) == _STREAM_BATCH_SIZE:
+            _write_stream_batch(fout, batch, count)
+            count += len(batch)
+            batch = []
+
+    _write_stream_batch(fout, batch, count)
+    count += len(batch)
+    fout.write(b'\n]' if count else b']')
+    return count
+
+
+def stream_process_file(input_path: str, output_path: str) -> int:
+    """
+    Validate, process and write items one at a time.
+
+    Only a small batch of items is held in memory at once, so this is suitable
+    for inputs too large to load in full. Output goes to a temporary file next
+    to output_path that replaces it only on success, so a failed run leaves any
+    existing output untouched and input and output may be the same file.
+
+    Args:
+        input_path: Path to input JSON file
+        output_path: Path to output JSON file
+
+    Returns:
+        The number of items processed
+
+    Raises:
+        ValidationError: If the input is invalid or a file cannot be accessed
+    """
+    if ijson is None:
+        raise ValidationError("Streaming requires the ijson package")
+
+    try:
+        fin = open(input_path, 'rb')
+    except FileNotFoundError:
+        raise ValidationError(f"Input file not found: {input_path}")
+    except PermissionError:
+        raise ValidationError(f"Permission denied reading file: {input_path}")
+    except OSError as e:
+        raise ValidationError(f"Error reading input file: {e}")
+
+    with fin:
+        # Replace the file a symlink points to, as writing through it would
+        target_path = os.path.realpath(output_path)
+        try:
+            fd, temp_path = _create_temp_output(target_path)
+        except PermissionError:
+            raise ValidationError(f"Permission denied writing to file: {output_path}")
+        except OSError as e:
+            # Report the requested path, not the temporary file name
+            error = OSError(e.errno, e.strerror, output_path)
+            raise ValidationError(f"Error writing output file: {error}")
+
+        try:
+            with os.fdopen(fd, 'wb') as fout:
+                try:
+                    count = _stream_items(fin, fout, ijson)
+                except ijson.JSONError as e:
+                    # yajl-based backends reject integers beyond 64 bits. Only
+                    # then is the input re-read with the pure-Python backend,
+                    # which accepts them but parses an order of magnitude slower.
+                    if ijson.backend == 'python' or _YAJL_INTEGER_OVERFLOW not in str(e):
+                        raise ValidationError(f"Invalid JSON in input file: {e}")
+                    fin.seek(0)
+                    fout.seek(0)
+                    fout.truncate()
+                    try:
+                        count = _stream_items(fin, fout, ijson.get_backend('python'))
+                    except ijson.JSONError as e:
+                        raise ValidationError(f"Invalid JSON in input file: {e}")
+
+            try:
+                _copy_existing_mode(target_path, temp_path)
+                os.replace(temp_path, target_path)
+            except PermissionError:
+                raise ValidationError(f"Permission denied writing to file: {output_path}")
+            except OSError as e:
+                error = OSError(e.errno, e.strerror, output_path)
+                raise ValidationError(f"Error writing output file: {error}")
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    logger.info("Successfully processed %d items", count)
+    logger.info("Successfully wrote output file: %s", output_path)
+    return count
+
+
+def process_command_stream(input_path: str, output_path: str) -> int:
+    """
+    Execute the process command, streaming items from input to output.
+
+    Args:
+        input_path: Path to input JSON file
+        output_path: Path to output JSON file
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    try:
+        stream_process_file(input_path, output_path)
+        return 0
+
+    except ValidationError as e:
+        logger.error("Validation error: %s", e)
+        return 1
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        return 1
+
+
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Create and configure the argument parser.
 
+    The parser is built once and reused; parse_args does not mutate it.
+
     Returns:
         Configured ArgumentParser
     """
@@ -268,7 +691,55 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main(args: list = None) -> int:
+def _parse_process_args(args: List[str]) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a plain 'process' command line without argparse.
+
+    Only the exact forms '--input X', '--output Y' and '-v'/'--verbose', each
+    given at most once, are recognised. Anything else (help, abbreviations,
+    '--opt=value', values starting with '-', missing flags) returns None so
+    that argparse handles it and reports errors as usual.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        (input_file, output_file, verbose), or None if argparse is needed
+    """
+    if not args or args[0] != 'process':
+        return None
+
+    input_file = None
+    output_file = None
+    verbose = False
+    i = 1
+    n = len(args)
+    while i < n:
+        arg = args[i]
+        if arg in ('--input', '--output'):
+            if i + 1 >= n or args[i + 1].startswith('-'):
+                return None
+            if arg == '--input':
+                if input_file is not None:
+                    return None
+                input_file = args[i + 1]
+            else:
+                if output_file is not None:
+                    return None
+                output_file = args[i + 1]
+            i += 2
+        elif arg in ('-v', '--verbose') and not verbose:
+            verbose = True
+            i += 1
+        else:
+            return None
+
+    if input_file is None or output_file is None:
+        return None
+    return input_file, output_file, verbose
+
+
+def main(args: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI tool.
 
@@ -278,8 +749,17 @@ def main(args: list = None) -> int:
     Returns:
         Exit code
     """
+    argv = sys.argv[1:] if args is None else args
+
+    # Plain 'process' invocations skip argparse entirely
+    fast_args = _parse_process_args(argv)
+    if fast_args is not None:
+        input_file, output_file, verbose = fast_args
+        setup_logging(verbose=verbose)
+        return process_command(input_file, output_file)
+
     parser = create_parser()
-    parsed_args = parser.parse_args(args)
+    parsed_args = parser.parse_args(argv)
 
     if parsed_args.command is None:
         parser.print_help()
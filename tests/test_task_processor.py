@@ -10,18 +10,24 @@ import os
 import subprocess
 import sys
 import tempfile
+from collections import Counter, defaultdict
 from pathlib import Path
 
 import pytest
 
+import src.task_processor as task_processor
 from src.task_processor import (
     ValidationError,
+    _has_long_int,
+    _parse_process_args,
     create_parser,
     main,
     process_command,
+    process_command_stream,
     process_items,
     read_input_file,
     setup_logging,
+    stream_process_file,
     validate_input,
     validate_item,
     write_output_file,
@@ -102,6 +108,35 @@ class TestValidateItem:
             validate_item(item, 0)
         assert "missing required field 'value'" in str(exc_info.value)
 
+    def test_missing_fields_reported_in_schema_order(self):
+        """Test that the first missing field in id/name/value order is reported."""
+        item = {'value': 100}
+        with pytest.raises(ValidationError) as exc_info:
+            validate_item(item, 3)
+        assert "Item at index 3 is missing required field 'id'" in str(exc_info.value)
+
+    def test_missing_field_in_dict_subclass(self):
+        """Test that missing fields are reported for dict subclasses with defaults."""
+        item = Counter({'id': 1, 'value': 100})
+        with pytest.raises(ValidationError) as exc_info:
+            validate_item(item, 0)
+        assert "missing required field 'name'" in str(exc_info.value)
+
+        item = defaultdict(int, {'id': 1, 'name': 'Test'})
+        with pytest.raises(ValidationError) as exc_info:
+            validate_item(item, 0)
+        assert "missing required field 'value'" in str(exc_info.value)
+
+    def test_clean_item_returned_without_copy(self):
+        """Test that an item with exactly the schema fields is returned as-is."""
+        item = {'id': 1, 'name': 'Test', 'value': 100}
+        assert validate_item(item, 0) is item
+
+    def test_extra_fields_dropped(self):
+        """Test that fields outside the schema are not returned."""
+        item = {'id': 1, 'name': 'Test', 'value': 100, 'extra': 'x'}
+        assert validate_item(item, 0) == {'id': 1, 'name': 'Test', 'value': 100}
+
     def test_id_not_integer(self):
         """Test that non-integer id is rejected."""
         item = {'id': '1', 'name': 'Test', 'value': 100}
@@ -130,6 +165,18 @@ class TestValidateItem:
             validate_item(item, 0)
         assert "'name' must be a non-empty string" in str(exc_info.value)
 
+    def test_name_unicode_whitespace_only(self):
+        """Test that a name of only non-ASCII whitespace is rejected."""
+        item = {'id': 1, 'name': '\u00a0\t\u3000', 'value': 100}
+        with pytest.raises(ValidationError) as exc_info:
+            validate_item(item, 0)
+        assert "'name' must be a non-empty string" in str(exc_info.value)
+
+    def test_name_with_surrounding_whitespace_accepted(self):
+        """Test that a name with surrounding whitespace is kept unchanged."""
+        item = {'id': 1, 'name': '  Test  ', 'value': 100}
+        assert validate_item(item, 0)['name'] == '  Test  '
+
     def test_value_not_numeric(self):
         """Test that non-numeric value is rejected."""
         item = {'id': 1, 'name': 'Test', 'value': 'hundred'}
@@ -158,6 +205,13 @@ class TestValidateItem:
             validate_item(item, 0)
         assert "'id' must be an integer" in str(exc_info.value)
 
+    def test_value_boolean_reports_bool(self):
+        """Test that the error for a boolean value names the bool type."""
+        item = {'id': 1, 'name': 'Test', 'value': False}
+        with pytest.raises(ValidationError) as exc_info:
+            validate_item(item, 0)
+        assert "'value' must be numeric, got bool" in str(exc_info.value)
+
     def test_valid_item_with_zero_value(self):
         """Test validation with zero value."""
         item = {'id': 1, 'name': 'Test', 'value': 0}
@@ -260,6 +314,179 @@ class TestFileOperations:
             read_input_file('/nonexistent/path/file.json')
         assert "Input file not found" in str(exc_info.value)
 
+    def test_read_integers_beyond_64_bits_exact(self):
+        """Test that integers outside the 64-bit range are not turned into floats."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('[{"id": 18446744073709551616, "name": "Big", '
+                    '"value": 123456789012345678901234567890}, '
+                    '{"id": -9223372036854775809, "name": "Small", "value": 1.5}]')
+            temp_path = f.name
+
+        try:
+            result = read_input_file(temp_path)
+            assert result[0]['id'] == 18446744073709551616
+            assert result[0]['value'] == 123456789012345678901234567890
+            assert result[1]['id'] == -9223372036854775809
+            assert type(result[1]['id']) is int
+        finally:
+            os.unlink(temp_path)
+
+    @pytest.mark.parametrize('number', ['NaN', 'Infinity', '-Infinity', '1e400'])
+    def test_read_non_finite_numbers_rejected(self, number):
+        """Test that NaN, Infinity and overflowing floats are rejected as invalid JSON."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write(f'[{{"id": 1, "name": "Test", "value": {number}}}]')
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                read_input_file(temp_path)
+            assert "Invalid JSON" in str(exc_info.value)
+        finally:
+            os.unlink(temp_path)
+
+    @pytest.mark.parametrize('number', ['NaN', 'Infinity', '-Infinity', '1e400'])
+    def test_read_non_finite_numbers_rejected_with_long_digit_run(self, number):
+        """Test that the stdlib fallback rejects the same non-finite numbers."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write(f'[{{"id": 1, "name": "000000000000000000000", "value": {number}}}]')
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                read_input_file(temp_path)
+            assert "Invalid JSON" in str(exc_info.value)
+        finally:
+            os.unlink(temp_path)
+
+    @pytest.mark.parametrize('value', ['1', '123456789012345678901'])
+    def test_read_lone_surrogate_rejected(self, value):
+        """Test that a lone surrogate escape is invalid JSON with and without the fallback."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write(f'[{{"id": 1, "name": "A\\ud800", "value": {value}}}]')
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                read_input_file(temp_path)
+            assert "Invalid JSON" in str(exc_info.value)
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_escaped_backslash_before_u_accepted(self):
+        """Test that an escaped backslash followed by 'ud800' is ordinary text."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('[{"id": 1, "name": "A\\\\ud800", "value": 123456789012345678901}]')
+            temp_path = f.name
+
+        try:
+            assert read_input_file(temp_path)[0]['name'] == 'A\\ud800'
+        finally:
+            os.unlink(temp_path)
+
+    @pytest.mark.parametrize('text, expected', [
+        (b'[1234567890123456789, 9223372036854775807]', False),
+        (b'[9999999999999999999, -922337203685477580]', False),
+        (b'[-9223372036854775809]', True),
+        (b'[18446744073709551616]', True),
+        (b'["id 12345678901234567890"]', True),
+    ])
+    def test_long_int_detection(self, text, expected):
+        """Test that only literals orjson cannot parse exactly trigger the fallback."""
+        assert _has_long_int(text) is expected
+
+    def test_write_integers_beyond_64_bits(self):
+        """Test that integers outside the 64-bit range are written exactly."""
+        data = [{'id': 2 ** 64, 'name': 'Café', 'value': 10 ** 30}]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            write_output_file(temp_path, data)
+            with open(temp_path, 'rb') as f:
+                content = f.read()
+            assert 'Café'.encode('utf-8') in content
+            assert json.loads(content) == data
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_directory(self):
+        """Test that a directory path raises ValidationError."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValidationError) as exc_info:
+                read_input_file(temp_dir)
+            assert "Error reading input file" in str(exc_info.value)
+
+    def test_read_empty_file(self):
+        """Test that an empty file is reported as invalid JSON."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                read_input_file(temp_path)
+            assert "Invalid JSON" in str(exc_info.value)
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_large_file(self):
+        """Test reading a file larger than a single read chunk."""
+        data = [{'id': i, 'name': f'Item {i}', 'value': i * 1.5} for i in range(20000)]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        try:
+            assert read_input_file(temp_path) == data
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_memory_mapped_file(self, monkeypatch):
+        """Test reading a file above the memory-map threshold."""
+        pytest.importorskip('orjson')
+
+        monkeypatch.setattr(task_processor, 'MMAP_THRESHOLD_BYTES', 0)
+        data = [{'id': 1, 'name': 'Café', 'value': 2.5}]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        try:
+            assert read_input_file(temp_path) == data
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_memory_mapped_integers_beyond_64_bits(self, monkeypatch):
+        """Test that the memory-mapped path keeps large integers exact."""
+        monkeypatch.setattr(task_processor, 'MMAP_THRESHOLD_BYTES', 0)
+        monkeypatch.setattr(task_processor, '_SCAN_CHUNK_SIZE', 8)
+        data = [{'id': 1, 'name': 'Test', 'value': 123456789012345678901234567890}]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(data, f)
+            temp_path = f.name
+
+        try:
+            assert read_input_file(temp_path) == data
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_memory_mapped_malformed_json(self, monkeypatch):
+        """Test that malformed JSON is reported from the memory-mapped path."""
+        pytest.importorskip('orjson')
+
+        monkeypatch.setattr(task_processor, 'MMAP_THRESHOLD_BYTES', 0)
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('[{ invalid json }]')
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                read_input_file(temp_path)
+            assert "Invalid JSON" in str(exc_info.value)
+        finally:
+            os.unlink(temp_path)
+
     def test_read_malformed_json(self):
         """Test reading malformed JSON file."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -289,10 +516,54 @@ class TestFileOperations:
         finally:
             os.unlink(temp_path)
 
+    def test_write_read_round_trip_unicode(self):
+        """Test that non-ASCII names survive a write/read round trip."""
+        data = [{'id': 1, 'name': 'Café ✓', 'value': 1.5}]
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            write_output_file(temp_path, data)
+            assert read_input_file(temp_path) == data
+        finally:
+            os.unlink(temp_path)
+
+    def test_read_invalid_utf8(self):
+        """Test that undecodable input bytes raise ValidationError."""
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as f:
+            f.write(b'[{"id": 1, "name": "\xff", "value": 1}]')
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValidationError):
+                read_input_file(temp_path)
+        finally:
+            os.unlink(temp_path)
+
 
 class TestProcessCommand:
     """Tests for process_command function."""
 
+    def test_large_integer_value_preserved(self):
+        """Test end-to-end that an integer beyond 64 bits is written unchanged."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('[{"id": 1, "name": "Big", "value": 123456789012345678901234567890}]')
+            input_path = f.name
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            output_path = f.name
+
+        try:
+            assert process_command(input_path, output_path) == 0
+
+            with open(output_path, 'r') as f:
+                result = json.load(f)
+            assert result[0]['value'] == 123456789012345678901234567890
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
     def test_successful_processing(self):
         """Test successful end-to-end processing."""
         input_data = [
@@ -339,6 +610,267 @@ class TestProcessCommand:
                 os.unlink(output_path)
 
 
+class TestStreamProcessing:
+    """Tests for the streaming process path."""
+
+    @pytest.fixture(autouse=True)
+    def require_ijson(self):
+        """Skip when the optional ijson dependency is unavailable."""
+        pytest.importorskip('ijson')
+
+    def _write_input(self, content, directory=None):
+        """Write content to a temporary input file and return its path."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.json', delete=False, dir=directory, encoding='utf-8'
+        ) as f:
+            f.write(content)
+            return f.name
+
+    def _output_path(self, directory=None):
+        """Return the path of a fresh temporary output file."""
+        with tempfile.NamedTemporaryFile(
+            mode='w', suffix='.json', delete=False, dir=directory
+        ) as f:
+            return f.name
+
+    def _batch_output(self, input_data):
+        """Return the bytes the in-memory path writes for input_data."""
+        output_path = self._output_path()
+        try:
+            write_output_file(output_path, process_items(validate_input(input_data)))
+            with open(output_path, 'rb') as f:
+                return f.read()
+        finally:
+            os.unlink(output_path)
+
+    def test_stream_matches_batch_output(self, monkeypatch):
+        """Test that streaming writes the same bytes as the batch path."""
+        monkeypatch.setattr(task_processor, '_STREAM_BATCH_SIZE', 2)
+        input_data = [
+            {'id': i, 'name': f'Item é {i}', 'value': i * 1.5, 'extra': 'ignored'}
+            for i in range(5)
+        ]
+        # An integer beyond 64 bits sends one record through the json fallback
+        input_data.append({'id': 5, 'name': 'café', 'value': 10 ** 30})
+        input_path = self._write_input(json.dumps(input_data, ensure_ascii=False))
+        output_path = self._output_path()
+
+        try:
+            assert stream_process_file(input_path, output_path) == 6
+
+            with open(output_path, 'rb') as f:
+                assert f.read() == self._batch_output(input_data)
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    def test_stream_empty_array(self):
+        """Test streaming an empty array."""
+        input_path = self._write_input('[]')
+        output_path = self._output_path()
+
+        try:
+            assert stream_process_file(input_path, output_path) == 0
+
+            with open(output_path, 'rb') as f:
+                assert f.read() == self._batch_output([])
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    def test_stream_integers_beyond_64_bits(self):
+        """Test that integers outside the 64-bit range are streamed exactly."""
+        input_path = self._write_input(
+            '[{"id": 18446744073709551616, "name": "Big", '
+            '"value": 123456789012345678901234567890}]'
+        )
+        output_path = self._output_path()
+
+        try:
+            assert stream_process_file(input_path, output_path) == 1
+
+            with open(output_path, 'r') as f:
+                result = json.load(f)
+            assert result[0]['id'] == 18446744073709551616
+            assert result[0]['value'] == 123456789012345678901234567890
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    def test_stream_same_input_and_output(self):
+        """Test that the input file can be overwritten with its own output."""
+        input_data = [{'id': 1, 'name': 'First', 'value': 10}]
+        input_path = self._write_input(json.dumps(input_data))
+
+        try:
+            assert stream_process_file(input_path, input_path) == 1
+
+            with open(input_path, 'rb') as f:
+                assert f.read() == self._batch_output(input_data)
+        finally:
+            os.unlink(input_path)
+
+    def test_stream_keeps_existing_output_permissions(self):
+        """Test that replacing an existing output file keeps its permission bits."""
+        input_path = self._write_input('[]')
+        output_path = self._output_path()
+        os.chmod(output_path, 0o640)
+
+        try:
+            stream_process_file(input_path, output_path)
+            assert os.stat(output_path).st_mode & 0o777 == 0o640
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    def test_stream_new_output_respects_umask(self):
+        """Test that a newly created output file gets the usual umask-derived mode."""
+        input_path = self._write_input('[]')
+        old_umask = os.umask(0o027)
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output_path = os.path.join(temp_dir, 'out.json')
+                stream_process_file(input_path, output_path)
+                assert os.stat(output_path).st_mode & 0o777 == 0o640
+        finally:
+            os.umask(old_umask)
+            os.unlink(input_path)
+
+    def test_stream_failure_keeps_existing_output(self):
+        """Test that a failure mid-stream leaves an existing output file untouched."""
+        input_data = [
+            {'id': 1, 'name': 'First', 'value': 10},
+            {'id': 1, 'name': 'Duplicate', 'value': 20},
+        ]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = self._write_input(json.dumps(input_data), temp_dir)
+            output_path = os.path.join(temp_dir, 'out.json')
+            with open(output_path, 'w') as f:
+                f.write('previous output')
+
+            assert process_command_stream(input_path, output_path) == 1
+
+            with open(output_path, 'r') as f:
+                assert f.read() == 'previous output'
+            assert sorted(os.listdir(temp_dir)) == sorted(
+                [os.path.basename(input_path), 'out.json']
+            )
+
+    def test_stream_not_a_list(self):
+        """Test that a non-array document is rejected."""
+        input_path = self._write_input('{"id": 1, "name": "Test", "value": 1}')
+        output_path = self._output_path()
+        os.unlink(output_path)
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                stream_process_file(input_path, output_path)
+            assert "Input must be a JSON array" in str(exc_info.value)
+            assert not os.path.exists(output_path)
+        finally:
+            os.unlink(input_path)
+
+    def test_stream_malformed_json(self):
+        """Test that truncated JSON raises ValidationError."""
+        input_path = self._write_input('[{"id": 1, "name": "Test", "value": 1}, {')
+        output_path = self._output_path()
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                stream_process_file(input_path, output_path)
+            assert "Invalid JSON" in str(exc_info.value)
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    def test_stream_malformed_json_not_reparsed(self, monkeypatch):
+        """Test that only integer overflow triggers the slow pure-Python re-parse."""
+        calls = []
+        monkeypatch.setattr(
+            task_processor.ijson, 'get_backend', lambda name: calls.append(name)
+        )
+        input_path = self._write_input('[{"id": 1, "name": "Test", "value": 1}, {')
+        output_path = self._output_path()
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                stream_process_file(input_path, output_path)
+            assert "Invalid JSON" in str(exc_info.value)
+            assert calls == []
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    @pytest.mark.parametrize("padding", [0, 65536 - 24])
+    def test_stream_lone_surrogate(self, padding):
+        """Test that a lone surrogate escape is rejected, even across read boundaries."""
+        # With the larger padding the escape straddles the first 64 KiB read
+        content = '[' + ' ' * padding + '{"id": 1, "name": "A\\ud800", "value": 1}]'
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_path = self._write_input(content, temp_dir)
+            output_path = os.path.join(temp_dir, 'out.json')
+            with open(output_path, 'w') as f:
+                f.write('previous output')
+
+            with pytest.raises(ValidationError) as exc_info:
+                stream_process_file(input_path, output_path)
+            assert "Invalid JSON" in str(exc_info.value)
+            assert "lone surrogate" in str(exc_info.value)
+
+            with open(output_path, 'r') as f:
+                assert f.read() == 'previous output'
+
+    def test_stream_surrogate_pair(self):
+        """Test that an escaped surrogate pair streams like the batch path."""
+        input_data = [{'id': 1, 'name': 'Smile \U0001F600', 'value': 1}]
+        input_path = self._write_input(json.dumps(input_data))
+        output_path = self._output_path()
+
+        try:
+            assert stream_process_file(input_path, output_path) == 1
+
+            with open(output_path, 'rb') as f:
+                assert f.read() == self._batch_output(input_data)
+        finally:
+            os.unlink(input_path)
+            os.unlink(output_path)
+
+    def test_stream_nonexistent_file(self):
+        """Test streaming a non-existent file."""
+        with pytest.raises(ValidationError) as exc_info:
+            stream_process_file('/nonexistent/path/file.json', 'out.json')
+        assert "Input file not found" in str(exc_info.value)
+
+    def test_stream_missing_output_directory(self):
+        """Test that an unwritable output location is reported like the batch path."""
+        input_path = self._write_input('[]')
+
+        try:
+            with pytest.raises(ValidationError) as exc_info:
+                stream_process_file(input_path, '/nonexistent/dir/out.json')
+            assert "Error writing output file" in str(exc_info.value)
+            assert "'/nonexistent/dir/out.json'" in str(exc_info.value)
+        finally:
+            os.unlink(input_path)
+
+    def test_process_command_uses_stream_above_threshold(self, monkeypatch):
+        """Test that process_command streams inputs above the size threshold."""
+        calls = []
+        monkeypatch.setattr(task_processor, 'STREAM_THRESHOLD_BYTES', 0)
+        monkeypatch.setattr(
+            task_processor, 'stream_process_file',
+            lambda *paths: calls.append(paths) or 0
+        )
+        input_path = self._write_input('[]')
+
+        try:
+            assert process_command(input_path, 'out.json') == 0
+            assert calls == [(input_path, 'out.json')]
+        finally:
+            os.unlink(input_path)
+
+
 class TestCLI:
     """Tests for CLI argument parsing."""
 
@@ -347,6 +879,19 @@ class TestCLI:
         parser = create_parser()
         assert parser is not None
 
+    def test_parser_is_reused(self):
+        """Test that repeated calls return the same cached parser."""
+        assert create_parser() is create_parser()
+
+    def test_cached_parser_parses_independently(self):
+        """Test that one parse does not leak state into the next."""
+        parser = create_parser()
+        first = parser.parse_args(['process', '--input', 'a.json', '--output', 'b.json', '-v'])
+        second = parser.parse_args(['process', '--input', 'c.json', '--output', 'd.json'])
+        assert first.verbose is True
+        assert second.verbose is False
+        assert second.input_file == 'c.json'
+
     def test_process_command_parsing(self):
         """Test parsing of process command."""
         parser = create_parser()
@@ -388,6 +933,45 @@ class TestCLI:
         assert args.verbose is False
 
 
+class TestFastArgParsing:
+    """Tests for the argparse-free 'process' command line fast path."""
+
+    @pytest.mark.parametrize('argv', [
+        ['process', '--input', 'in.json', '--output', 'out.json'],
+        ['process', '--output', 'out.json', '--input', 'in.json'],
+        ['process', '--input', 'in.json', '--output', 'out.json', '-v'],
+        ['process', '-v', '--input', 'in.json', '--output', 'out.json'],
+        ['process', '--input', 'in.json', '--verbose', '--output', 'out.json'],
+    ])
+    def test_matches_argparse(self, argv):
+        """Test that recognised command lines parse the same as argparse."""
+        expected = create_parser().parse_args(argv)
+        assert _parse_process_args(argv) == (
+            expected.input_file, expected.output_file, expected.verbose
+        )
+
+    @pytest.mark.parametrize('argv', [
+        [],
+        ['--help'],
+        ['process', '--help'],
+        ['process', '--input', 'in.json'],
+        ['process', '--input=in.json', '--output', 'out.json'],
+        ['process', '--in', 'in.json', '--output', 'out.json'],
+        ['process', '--input', '-x', '--output', 'out.json'],
+        ['process', '--input', 'a.json', '--input', 'b.json', '--output', 'out.json'],
+        ['process', '--input', 'in.json', '--output', 'out.json', '-v', '-v'],
+        ['process', '--input', 'in.json', '--output', 'out.json', 'extra'],
+    ])
+    def test_falls_back_to_argparse(self, argv):
+        """Test that anything unusual is left to argparse."""
+        assert _parse_process_args(argv) is None
+
+    def test_main_invalid_args_still_exit(self):
+        """Test that argparse errors are still raised for unrecognised input."""
+        with pytest.raises(SystemExit):
+            main(['process', '--input', 'in.json'])
+
+
 class TestMainFunction:
     """Tests for main entry point."""
 